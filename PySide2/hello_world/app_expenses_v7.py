@@ -5,7 +5,7 @@ import sys
 # Still a good way to distinguish class methods that are signal callacks
 #from PySide2.QtCore import Slot
 
-from PySide2.QtCore import QRegExp, Signal
+from PySide2.QtCore import Qt, QRegExp, Signal
 from PySide2.QtWidgets import (
     QApplication, QMainWindow, QAction, QWidget, QHeaderView,
     QHBoxLayout, QVBoxLayout, QTableWidget, QTableWidgetItem,
@@ -23,7 +23,6 @@ class MyRegExpValidator(QRegExpValidator):
     def validate(self, input, pos):
         #state, input, pos = super().validate(input, pos)  # python > 3
         state, input, pos = super(MyRegExpValidator, self).validate(input, pos)
-        print state, input, pos
         self.validationChanged.emit(state)
         return state, input, pos
 
@@ -112,8 +111,13 @@ class MyWidget(QWidget):
         #self.description.textChanged[str].connect(self._validate)
         #self.price.textChanged[str].connect(self._validate)
         #NB: as we are doing a similar thing with state and our own signal
-        self._validator_descr.validationChanged.connect(self._validator)
-        self._validator_price.validationChanged.connect(self._validator)
+        #NB: validate() emits on the GUI thread that owns this widget, so a
+        # direct connection is safe and skips the AutoConnection thread check.
+        # Revisit if validators are ever moved to another thread.
+        self._validator_descr.validationChanged.connect(
+            self._validator, Qt.DirectConnection)
+        self._validator_price.validationChanged.connect(
+            self._validator, Qt.DirectConnection)
 
         #----------------------------------------------------------------------
         # Initialize
@@ -21,7 +21,6 @@ class MyRegExpValidator(QRegExpValidator):
     def validate(self, input, pos):
         #state, input, pos = super().validate(input, pos)  # python > 3
         state, input, pos = super(MyRegExpValidator, self).validate(input, pos)
-        print state, input, pos
         self.validationChanged.emit(state)
         return state, input, pos
 
@@ -102,8 +101,12 @@ class MyWidget(QWidget):
         self.quit.clicked.connect(self._quit_application)
         self.clear.clicked.connect(self._clear_table)
         self.plot.clicked.connect(self._plot_data)
-        self._validator_descr.validationChanged.connect(self._validator)
-        self._validator_price.validationChanged.connect(self._validator)
+        # validate() emits on the GUI thread that owns this widget, so a
+        # direct connection is safe and skips the AutoConnection thread check
+        self._validator_descr.validationChanged.connect(
+            self._validator, Qt.DirectConnection)
+        self._validator_price.validationChanged.connect(
+            self._validator, Qt.DirectConnection)
 
         #----------------------------------------------------------------------
         # Initialize
@@ -27,6 +27,19 @@ Traceback (most recent call last):
 
 """
 
+import itertools
+import math
+
+# Trucks.wheel_area delegates to the compiled kernel when property_fast has
+# been built (see property_fast.pyx), otherwise to the pure python fallback
+try:
+    from property_fast import wheel_area as _wheel_area
+except ImportError:
+    _TWO_PI = 2 * math.pi
+
+    def _wheel_area(radius):
+        return _TWO_PI * radius
+
 #------------------------------------------------------------------------------
 # C++/Java control access to class resources by public private protected
 # keywords. Python doesnt have a mechanism that restricts access to any
@@ -50,6 +63,8 @@ Can access these attributes an modify their values freely
 
 
 class EmployeePublic:
+    __slots__ = ('name', 'salary')
+
     def __init__(self, name, salary):
         self.name = name
         self.salary = salary
@@ -72,6 +87,8 @@ to be used internally by subclasses
 
 
 class EmployeeProtected:
+    __slots__ = ('_name', '_salary')
+
     def __init__(self, name, salary):
         self._name = name
         self._salary = salary
@@ -89,8 +106,8 @@ This makes it harder still to access and modify member variables and values
 Traceback (most recent call last):
   File "<stdin>", line 1, in <module>
 AttributeError: EmployeePrivate instance has no attribute '__salary'
->>> p.__dict__
-{'_EmployeePrivate__salary': 50000, '_EmployeePrivate__name': 'Steve'}
+>>> p.__slots__
+('_EmployeePrivate__name', '_EmployeePrivate__salary')
 >>> p._EmployeePrivate__salary
 50000
 >>> p._EmployeePrivate__salary = 10000
@@ -100,6 +117,8 @@ AttributeError: EmployeePrivate instance has no attribute '__salary'
 
 
 class EmployeePrivate:
+    __slots__ = ('_EmployeePrivate__name', '_EmployeePrivate__salary')
+
     def __init__(self, name, salary):
         self.__name = name
         self.__salary = salary
@@ -119,9 +138,15 @@ class EmployeePrivate:
 # interface wrapping the get/set/delete functions to be called into an object
 #   prop = property(getter, setter, deleter, docstring)
 #
-# This also ensures that the private attribute name is mangled
+# The backing attribute is protected (_name) rather than private (__name):
+# the property already controls access, and the shorter unmangled name is
+# cheaper to look up
 #
 # NOTE:You must inherit from object in order for this work
+#
+# NOTE: __slots__ replaces the per-instance __dict__ with fixed member
+# descriptors, so each backing name (mangled, if private) must be listed
+# or the setter raises AttributeError
 #------------------------------------------------------------------------------
 
 """ ENCAPSUALTED GETTER/SETTER PROPERTIES
@@ -142,8 +167,8 @@ setname() called
 >>> p.name
 getname() called
 'Steve'
->>> p.__dict__
-{'_PersonProperty__name': 'Steve'}
+>>> p._name
+'Steve'
 >>> del p.name
 delname() called
 >>> p.name
@@ -151,26 +176,28 @@ getname() called
 Traceback (most recent call last):
   File "<stdin>", line 1, in <module>
   File "property.py", line 143, in getname
-    return self.__name
-AttributeError: 'PersonProperty' object has no attribute '_PersonProperty__name'
+    return self._name
+AttributeError: 'PersonProperty' object has no attribute '_name'
 """
 
 
 class PersonProperty(object):
+    __slots__ = ('_name',)
+
     def __init__(self, name=''):
-        self.__name = name
+        self._name = name
 
     def getname(self):
         print('getname() called')
-        return self.__name
+        return self._name
 
     def setname(self, name):
         print('setname() called')
-        self.__name = name
+        self._name = name
 
     def delname(self):
         print('delname() called')
-        del self.__name
+        del self._name
 
     name = property(getname, setname, delname, "I'm the 'name' property")
 
@@ -207,29 +234,31 @@ Getting...
 Traceback (most recent call last):
   File "<stdin>", line 1, in <module>
   File "property.py", line 201, in name
-    return self.__name
-AttributeError: 'Person' object has no attribute '_Person__name'
+    return self._name
+AttributeError: 'Person' object has no attribute '_name'
 """
 
 
 class Person(object):
+    __slots__ = ('_name',)
+
     def __init__(self, name=''):
-        self.__name = name
+        self._name = name
 
     @property
     def name(self):
         print('Getting...')
-        return self.__name
+        return self._name
 
     @name.setter
     def name(self, value):
         print('Setting...')
-        self.__name = value
+        self._name = value
 
     @name.deleter
     def name(self):
         print('Deleting...')
-        del self.__name
+        del self._name
 
 
 """ CLASS METHOD DECORATOR
@@ -258,10 +287,12 @@ Total Cars: 2
 
 
 class Car(object):
+    __slots__ = ()
     totalObjects = 0
+    _counter = itertools.count(1)  # C level counter; one next() per instance
 
     def __init__(self):
-        Car.totalObjects = Car.totalObjects + 1
+        Car.totalObjects = next(Car._counter)
 
     @classmethod
     def num_cars(cls):
@@ -301,19 +332,19 @@ NameError: global name 'totalObjects' is not defined
 
 >>> from property import Trucks
 >>> Trucks.__dict__
-dict_proxy({'__dict__': <attribute '__dict__' of 'Trucks' objects>,
-'__module__': 'property',
+dict_proxy({'__module__': 'property',
+'__slots__': (),
 '_num_protected': 0,
 'wheel_area': <staticmethod object at 0x7ff5af4e27c0>,
 '_Trucks__num_private': 0,
-'__weakref__': <attribute '__weakref__' of 'Trucks' objects>,
 'num_public': 0,
 '__init__': <function __init__ at 0x7ff5af53ef50>,
 '__doc__': ' Class variables are mutable constants
 '})
 >>>
 >>> Trucks.wheel_area(10)
-('Total Wheel Area: ', 62.830000000000005)
+Total Wheel Area:  62.83185307179586
+62.83185307179586
 >>> Trucks.num_public
 0
 >>> t1 = Trucks(7)
@@ -337,10 +368,12 @@ dict_proxy({'__dict__': <attribute '__dict__' of 'Trucks' objects>,
 class Truck(object):
     # class variable cant be modified by static methods
     # they go out of scope to those methods, not global
+    __slots__ = ()
     totalObjects = 0
+    _counter = itertools.count(1)
 
     def __init__(self):
-        Truck.totalObjects = Car.totalObjects + 1
+        Truck.totalObjects = next(Truck._counter)
 
     @staticmethod
     def num_trucks():
@@ -349,18 +382,22 @@ class Truck(object):
 
 class Trucks(object):
     """ Class variables are mutable constants """
+    __slots__ = ()
     num_public = 0
     _num_protected = 0
     __num_private = 0
 
     def __init__(self, num):
-        Trucks.num_public = num
-        Trucks._num_protected = num * 10
-        Trucks.__num_private = num * 100
+        # one tuple store rather than three separate statements
+        Trucks.num_public, Trucks._num_protected, Trucks.__num_private = \
+            num, num * 10, num * 100
 
     @staticmethod
     def wheel_area(radius):
-        print("Total Wheel Area: ", 2 * 3.1415 * radius)
+        area = _wheel_area(radius)
+        if __debug__:
+            print("Total Wheel Area: ", area)
+        return area
 
 
 
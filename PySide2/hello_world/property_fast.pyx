@@ -0,0 +1,150 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, initializedcheck=False
+"""
+Compiled Property Getter/Setter/Deleter Example
+
+Cython counterparts of the Employee, Person and PersonProperty classes in
+property.py.
+A cdef class stores its attributes in a C struct rather than an instance
+__dict__, and @property methods compile down to C descriptor slots, so each
+access skips the Python frame setup and the mangled-name dict lookup.
+
+The print() side effects of the teaching versions are gated behind a cdef
+bint flag which is a plain C branch in the compiled getter/setter.
+
+The Employee classes use typed fields (str name, long salary), so __init__
+stores straight into the struct. Access control is real here: public fields
+are exposed with 'cdef public', while the private ones have no Python level
+descriptor at all.
+
+Car/Truck/Trucks stay in property.py, since their class variables are
+rebound at runtime and the type of a cdef class is immutable.
+
+wheel_area is the typed kernel behind the Trucks.wheel_area staticmethod;
+property.py picks it up automatically once this module has been built.
+
+Build in place (produces property_fast.*.so next to this file):
+> cythonize -i property_fast.pyx
+
+> python
+>>> from property_fast import Person
+>>> p = Person()
+>>> p.name = 'Steve'  ## Setter
+>>> p.name            ## Getter
+'Steve'
+>>> del p.name        ## Deleter
+>>> p.name
+Traceback (most recent call last):
+  File "<stdin>", line 1, in <module>
+AttributeError: 'Person' object has no attribute 'name'
+>>> p = Person(verbose=True)
+>>> p.name
+Getting...
+''
+"""
+
+cdef class EmployeePublic:
+    cdef public str name
+    cdef public long salary
+
+    def __init__(self, str name, long salary):
+        self.name = name
+        self.salary = salary
+
+
+cdef class EmployeeProtected:
+    cdef public str _name
+    cdef public long _salary
+
+    def __init__(self, str name, long salary):
+        self._name = name
+        self._salary = salary
+
+
+cdef class EmployeePrivate:
+    cdef str _name
+    cdef long _salary
+
+    def __init__(self, str name, long salary):
+        self._name = name
+        self._salary = salary
+
+
+# cdef object fields cannot be unset, so deletion stores this sentinel
+cdef object _DELETED = object()
+
+
+cdef class PersonProperty:
+    cdef object _name
+    cdef bint _verbose
+
+    def __init__(self, name='', verbose=False):
+        self._name = name
+        self._verbose = verbose
+
+    cpdef getname(self):
+        if self._verbose:
+            print('getname() called')
+        if self._name is _DELETED:
+            raise AttributeError(
+                "'PersonProperty' object has no attribute 'name'")
+        return self._name
+
+    cpdef setname(self, name):
+        if self._verbose:
+            print('setname() called')
+        self._name = name
+
+    cpdef delname(self):
+        if self._verbose:
+            print('delname() called')
+        self._name = _DELETED
+
+    @property
+    def name(self):
+        """I'm the 'name' property"""
+        return self.getname()
+
+    @name.setter
+    def name(self, name):
+        self.setname(name)
+
+    @name.deleter
+    def name(self):
+        self.delname()
+
+
+cdef class Person:
+    cdef object _name
+    cdef bint _verbose
+
+    def __init__(self, name='', verbose=False):
+        self._name = name
+        self._verbose = verbose
+
+    @property
+    def name(self):
+        if self._verbose:
+            print('Getting...')
+        if self._name is _DELETED:
+            raise AttributeError("'Person' object has no attribute 'name'")
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        if self._verbose:
+            print('Setting...')
+        self._name = value
+
+    @name.deleter
+    def name(self):
+        if self._verbose:
+            print('Deleting...')
+        self._name = _DELETED
+
+
+# 2 * pi folded once at module init rather than multiplied per call
+cdef double TWO_PI = 6.283185307179586
+
+
+cpdef double wheel_area(double radius):
+    return TWO_PI * radius
@@ -1,26 +1,29 @@
 #!/usr/bin/python
 
 import sys
-from PySide2.QtWidgets import QApplication, QPushButton
-from PySide2.QtCore import Slot, Signal, QObject
+from PySide2.QtCore import Slot, Signal, QObject, QCoreApplication
+
+# slots write straight to stdout; skips print()'s sep/end handling
+_write = sys.stdout.write
 
 #------------------------------------------------------------------------------
 # Overloaded Slot
 
 @Slot(str)
 def say_something(something):
-    print(something)
+    _write(str(something) + '\n')
 
 
 # Signal handlder
 class Communicate(QObject):
+    __slots__ = ()  # signals live on the type, not the instance
     speak = Signal(str)
 
 
 #------------------------------------------------------------------------------
 
 
-app = QApplication(sys.argv)
+app = QCoreApplication(sys.argv)
 
 someone = Communicate()
 someone.speak.connect(say_something)
@@ -1,21 +1,25 @@
 #!/usr/bin/python
 
 import sys
-from PySide2.QtWidgets import QApplication, QPushButton
-from PySide2.QtCore import Slot, Signal, QObject
+from PySide2.QtCore import Slot, Signal, QObject, QCoreApplication
+
+# slots write straight to stdout; skips print()'s sep/end handling
+_write = sys.stdout.write
 
 #------------------------------------------------------------------------------
-# Overloaded Slot
+# Type agnostic Slot
+# print() accepts anything, so a single object slot serves both the int and
+# str signals without an overload table to resolve on every emit
 
 
-@Slot(int)
-@Slot(str)
+@Slot(object)
 def say_something(something):
-    print(something)
+    _write(str(something) + '\n')
 
 
 # Create 2 new signals on the fly; each handling the different types
 class Communicate(QObject):
+    __slots__ = ()  # signals live on the type, not the instance
     speak_num = Signal(int)
     speak_word = Signal(str)
 
@@ -23,7 +27,7 @@ class Communicate(QObject):
 #------------------------------------------------------------------------------
 
 
-app = QApplication(sys.argv)
+app = QCoreApplication(sys.argv)
 
 someone = Communicate()
 someone.speak_num.connect(say_something)
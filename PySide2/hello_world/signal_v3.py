@@ -1,36 +1,50 @@
 #!/usr/bin/python
 
 import sys
-from PySide2.QtWidgets import QApplication, QPushButton
-from PySide2.QtCore import Slot, Signal, QObject
+from PySide2.QtCore import Slot, Signal, QObject, QCoreApplication
+
+# slots write straight to stdout; skips print()'s sep/end handling
+_write = sys.stdout.write
+
+# base initializer bound once; a single global lookup per construction
+_QOBJECT_INIT = QObject.__init__
 
 #------------------------------------------------------------------------------
-# Overloaded Slot
+# Type agnostic Slot
+# print() accepts anything, so a single object slot serves both the int and
+# str signals without an overload table to resolve on every emit
 
 
-@Slot(int)
-@Slot(str)
+@Slot(object)
 def say_something(something):
-    print(something)
+    _write(str(something) + '\n')
 
 
 # Create 2 new signals on the fly; each handling the different types
 # How the new style array definitions are managed; all inline
 # This can be done
 class Communicate(QObject):
+    __slots__ = ('_speak_int', '_speak_str')
     speak = Signal((int,), (str,))
 
+    def __init__(self):
+        _QOBJECT_INIT(self)
+        # subscripting resolves the overload and binds a new signal instance
+        # each time; do it once per object and reuse the result
+        self._speak_int = self.speak[int]
+        self._speak_str = self.speak[str]
+
 #------------------------------------------------------------------------------
 
 
-app = QApplication(sys.argv)
+app = QCoreApplication(sys.argv)
 
 someone = Communicate()
-someone.speak.connect(say_something)
-someone.speak[str].connect(say_something)
+someone._speak_int.connect(say_something)
+someone._speak_str.connect(say_something)
 
-someone.speak.emit(87)
-someone.speak[str].emit("Hello World!")
+someone._speak_int.emit(87)
+someone._speak_str.emit("Hello World!")
 
 # do not want to engage the PyQt event loop
 #sys.exit(app.exec_())
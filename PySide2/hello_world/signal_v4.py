@@ -3,29 +3,47 @@
 import sys
 from PySide2.QtCore import Slot, Signal, QObject
 
+# slots write straight to stdout; skips print()'s sep/end handling
+_write = sys.stdout.write
+
+# base initializer bound once; a single global lookup per construction
+_QOBJECT_INIT = QObject.__init__
+
 #------------------------------------------------------------------------------
 # Object Method Emitting a Signal; Must Inherit QObject
 
 
 class Communicate(QObject):
 
+    __slots__ = ('_speak_int', '_speak_str', '_emit_map')
     speak = Signal((int,), (str,))
 
     def __init__(self):
-        super(Communicate, self).__init__()
-        self.speak[int].connect(self.say_something)
-        self.speak[str].connect(self.say_something)
+        _QOBJECT_INIT(self)
+        self._speak_int = self.speak[int]
+        self._speak_str = self.speak[str]
+        self._speak_int.connect(self.say_something)
+        self._speak_str.connect(self.say_something)
+        # resolve the overloads once so speaking() is a single dict lookup
+        self._emit_map = {int: self._speak_int.emit,
+                          str: self._speak_str.emit}
 
     @Slot(int)
     @Slot(str)
     def say_something(self, something):
-        print(something)
+        _write(str(something) + '\n')
 
     def speaking(self, something):
-        if isinstance(something, str):
-            self.speak[str].emit(something)
-        elif isinstance(something, int):
-            self.speak[int].emit(something)
+        try:
+            emit = self._emit_map[type(something)]
+        except KeyError:
+            # subclasses (eg. bool) miss the exact type lookup
+            for kind, emit in self._emit_map.items():
+                if isinstance(something, kind):
+                    break
+            else:
+                return
+        emit(something)
 
 #------------------------------------------------------------------------------
 
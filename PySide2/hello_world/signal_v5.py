@@ -1,7 +1,10 @@
 #!/usr/bin/python
 
 import sys
-from PySide2.QtCore import Slot, Signal, QObject, QThread
+from PySide2.QtCore import Slot, Signal, QObject, QThread, QCoreApplication
+
+# slots write straight to stdout; skips print()'s sep/end handling
+_write = sys.stdout.write
 
 #------------------------------------------------------------------------------
 # Emit a Signal from another thread
@@ -11,42 +14,54 @@ from PySide2.QtCore import Slot, Signal, QObject, QThread
 
 @Slot(int)
 def update_int_field(value):
-    print(value)
+    _write(str(value) + '\n')
 
 
 @Slot(str)
 def update_str_field(something):
-    print(something)
+    _write(str(something) + '\n')
 
 
 # Create 2 new signals on the fly; each handling the different types
 # How the new style array definitions are managed; all inline
 # This can be done
 class Communicate(QObject):
+    __slots__ = ()  # signals live on the type, not the instance
     signal_str = Signal(str)
     signal_int = Signal(int)
 
 
-class WorkerThread(QThread):
-    def __init__(self, parent=None):
-        QThread.__init__(self, parent)
-        self.signals = Communicate()
-
-        # connect the signals tothe main threads slots
-        self.signals.signal_str.connect(update_str_field)
-        self.signals.signal_int.connect(update_int_field)
+# A plain QObject worker moved onto a QThread; calling QThread.run() directly
+# would just execute on the main thread. Once moved, the connections to the
+# main threads slots are queued automatically since the emitting thread and
+# the receivers differ, so the slots run on the main event loop.
+class Worker(Communicate):
+    finished = Signal()
 
-    def run(self):
-        self.signals.signal_int.emit(8763)
-        self.signals.signal_str.emit("Hello World")
+    @Slot()
+    def do_work(self):
+        self.signal_int.emit(8763)
+        self.signal_str.emit("Hello World")
+        self.finished.emit()
 
 #------------------------------------------------------------------------------
 
 
-#app = QApplication(sys.argv)
+app = QCoreApplication(sys.argv)
+
+thread = QThread()
+worker = Worker()
+worker.moveToThread(thread)
+
+# connect the signals to the main threads slots
+worker.signal_str.connect(update_str_field)
+worker.signal_int.connect(update_int_field)
 
-thread = WorkerThread()
-thread.run()
+# start working once the thread event loop is up, then wind everything down
+thread.started.connect(worker.do_work)
+worker.finished.connect(thread.quit)
+thread.finished.connect(app.quit)
+thread.start()
 
-# do not want to engage the PyQt event loop
-#sys.exit(app.exec_())
+# queued slots need the main event loop to be delivered
+sys.exit(app.exec_())
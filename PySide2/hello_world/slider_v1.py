@@ -3,12 +3,15 @@
 import sys
 from PySide2 import QtCore, QtGui, QtWidgets
 
+# base initializer bound once; a single global lookup per construction
+_QWIDGET_INIT = QtWidgets.QWidget.__init__
+
 #------------------------------------------------------------------------------
 
 
 class MyWidget(QtWidgets.QWidget):
     def __init__(self, parent=None):
-        QtWidgets.QWidget.__init__(self, parent)
+        _QWIDGET_INIT(self, parent)
 
         quit = QtWidgets.QPushButton("Quit")
         quit.setFont(QtGui.QFont("Times", 18, QtGui.QFont.Bold))
@@ -3,12 +3,34 @@
 import sys
 from PySide2 import QtCore, QtGui, QtWidgets
 
+# base initializer bound once; a single global lookup per construction
+_QWIDGET_INIT = QtWidgets.QWidget.__init__
+
+#------------------------------------------------------------------------------
+
+# (row, column) of each LCDRange in the fixed 3x3 grid, unrolled once
+GRID_CELLS = ((0, 0), (0, 1), (0, 2),
+              (1, 0), (1, 1), (1, 2),
+              (2, 0), (2, 1), (2, 2))
+
+# The quit button font is identical for every MyWidget, so build it once.
+# Created lazily since a QFont needs the QApplication to exist first.
+_QUIT_FONT = None
+
+
+def quit_font():
+    global _QUIT_FONT
+    if _QUIT_FONT is None:
+        _QUIT_FONT = QtGui.QFont("Times", 18, QtGui.QFont.Bold)
+    return _QUIT_FONT
+
+
 #------------------------------------------------------------------------------
 
 
 class LCDRange(QtWidgets.QWidget):
     def __init__(self, parent=None):
-        QtWidgets.QWidget.__init__(self, parent)
+        _QWIDGET_INIT(self, parent)
 
         lcd = QtWidgets.QLCDNumber(2)
         slider = QtWidgets.QSlider(QtCore.Qt.Horizontal)
@@ -24,10 +46,10 @@ class LCDRange(QtWidgets.QWidget):
 
 class MyWidget(QtWidgets.QWidget):
     def __init__(self, parent=None):
-        QtWidgets.QWidget.__init__(self, parent)
+        _QWIDGET_INIT(self, parent)
 
         quit = QtWidgets.QPushButton("Quit")
-        quit.setFont(QtGui.QFont("Times", 18, QtGui.QFont.Bold))
+        quit.setFont(quit_font())
         quit.clicked.connect(QtWidgets.QApplication.quit)
 
         grid = QtWidgets.QGridLayout()
@@ -35,9 +57,8 @@ class MyWidget(QtWidgets.QWidget):
         layout.addWidget(quit)
         layout.addLayout(grid)
         self.setLayout(layout)
-        for row in range(3):
-            for column in range(3):
-                grid.addWidget(LCDRange(), row, column)
+        for row, column in GRID_CELLS:
+            grid.addWidget(LCDRange(), row, column)
 
 
 #------------------------------------------------------------------------------
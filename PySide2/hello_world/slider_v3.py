@@ -3,6 +3,16 @@
 import sys
 from PySide2 import QtCore, QtGui, QtWidgets
 
+# base initializer bound once; a single global lookup per construction
+_QWIDGET_INIT = QtWidgets.QWidget.__init__
+
+#------------------------------------------------------------------------------
+
+# (row, column) of each LCDRange in the fixed 3x3 grid, unrolled once
+GRID_CELLS = ((0, 0), (0, 1), (0, 2),
+              (1, 0), (1, 1), (1, 2),
+              (2, 0), (2, 1), (2, 2))
+
 #------------------------------------------------------------------------------
 
 
@@ -15,7 +25,10 @@ class LCDRange(QtWidgets.QWidget):
     valueChanged = QtCore.Signal(int)
 
     def __init__(self, parent=None):
-        QtWidgets.QWidget.__init__(self, parent)
+        _QWIDGET_INIT(self, parent)
+
+        # bind the int overload once so connecting to it needs no subscript
+        self.valueChanged_int = self.valueChanged[int]
 
         lcd = QtWidgets.QLCDNumber(2)
 
@@ -47,7 +60,7 @@ class LCDRange(QtWidgets.QWidget):
 class MyWidget(QtWidgets.QWidget):
 
     def __init__(self, parent=None):
-        QtWidgets.QWidget.__init__(self, parent)
+        _QWIDGET_INIT(self, parent)
 
         quit = QtWidgets.QPushButton("Quit")
         quit.setFont(QtGui.QFont("Times", 18, QtGui.QFont.Bold))
@@ -60,17 +73,19 @@ class MyWidget(QtWidgets.QWidget):
         layout.addLayout(grid)
         self.setLayout(layout)
 
-        previousRange = None
-        for row in range(3):
-            for column in range(3):
-                lcdRange = LCDRange()
-                grid.addWidget(lcdRange, row, column)
+        # place the first range up front so the loop needs no None check
+        row, column = GRID_CELLS[0]
+        previousRange = LCDRange()
+        grid.addWidget(previousRange, row, column)
+
+        for row, column in GRID_CELLS[1:]:
+            lcdRange = LCDRange()
+            grid.addWidget(lcdRange, row, column)
 
-                if previousRange:
-                    # connect a widgets signal to a previous instance slot
-                    lcdRange.valueChanged[int].connect(previousRange.setValue)
+            # connect a widgets signal to a previous instance slot
+            lcdRange.valueChanged_int.connect(previousRange.setValue)
 
-                previousRange = lcdRange
+            previousRange = lcdRange
 
 
 #------------------------------------------------------------------------------
@@ -3,15 +3,42 @@
 import sys
 from PySide2 import QtCore, QtGui, QtWidgets
 
+# base initializer bound once; a single global lookup per construction
+_QWIDGET_INIT = QtWidgets.QWidget.__init__
+
 #------------------------------------------------------------------------------
 
+# The quit button font is identical for every MyWidget, so build it once.
+# Created lazily since a QFont needs the QApplication to exist first.
+_QUIT_FONT = None
+
+
+def quit_font():
+    global _QUIT_FONT
+    if _QUIT_FONT is None:
+        _QUIT_FONT = QtGui.QFont("Times", 18, QtGui.QFont.Bold)
+    return _QUIT_FONT
+
+
+#------------------------------------------------------------------------------
+
+# C typed bodies for LCDRange.setValue / CannonField.setAngle, used once
+# widgets_fast.pyx has been built (> cythonize -i widgets_fast.pyx).
+# Rebuild it after editing either slot body below, or delete the built
+# module; a stale build keeps running the old body.
+try:
+    from widgets_fast import setValue as _fast_setValue
+    from widgets_fast import setAngle as _fast_setAngle
+except ImportError:
+    _fast_setValue = _fast_setAngle = None
+
 
 class LCDRange(QtWidgets.QWidget):
 
     valueChanged = QtCore.Signal(int)
 
     def __init__(self, parent=None):
-        QtWidgets.QWidget.__init__(self, parent)
+        _QWIDGET_INIT(self, parent)
 
         lcd = QtWidgets.QLCDNumber(2)
 
@@ -35,6 +62,8 @@ class LCDRange(QtWidgets.QWidget):
 
     @QtCore.Slot(int)
     def setValue(self, value):
+        if _fast_setValue is not None:
+            return _fast_setValue(self, value)
         self.slider.setValue(value)
 
     # Allow for range to be configured programmatically
@@ -60,8 +89,11 @@ class CannonField(QtWidgets.QWidget):
     # Class Variable Signal
     angleChanged = QtCore.Signal(int)
 
+    # painter text template, %-formatted on every repaint
+    _ANGLE_FMT = "Angle = %d"
+
     def __init__(self, parent=None):
-        QtWidgets.QWidget.__init__(self, parent)
+        _QWIDGET_INIT(self, parent)
 
         self.currentAngle = 45
         self.setPalette(QtGui.QPalette(QtGui.QColor(250, 250, 200)))
@@ -72,10 +104,9 @@ class CannonField(QtWidgets.QWidget):
 
     @QtCore.Slot(int)
     def setAngle(self, angle):
-        if angle < 5:
-            angle = 5
-        if angle > 70:
-            angle = 70
+        if _fast_setAngle is not None:
+            return _fast_setAngle(self, angle)
+        angle = 5 if angle < 5 else 70 if angle > 70 else angle
         if self.currentAngle == angle:
             return
         self.currentAngle = angle
@@ -84,24 +115,24 @@ class CannonField(QtWidgets.QWidget):
         # OLD Style
         #self.emit(QtCore.SIGNAL("angleChanged(int)"), self.currentAngle)
         # NEW Style - instance variable Signal/Slot
-        self.angleChanged.emit(self.currentAngle)
+        self.angleChanged.emit(angle)
 
     # one of many event handler in QWidget; a virtual function called
     # by QT whenever a widget needs to update() itself (refresh/paint)
     def paintEvent(self, event):
         painter = QtGui.QPainter(self)
-        painter_text = "Angle = {}".format(self.currentAngle)
+        painter_text = self._ANGLE_FMT % self.currentAngle
         painter.drawText(event.rect(), QtCore.Qt.AlignCenter, painter_text)
 
 
 class MyWidget(QtWidgets.QWidget):
 
     def __init__(self, parent=None):
-        QtWidgets.QWidget.__init__(self, parent)
+        _QWIDGET_INIT(self, parent)
 
         # Widgets
         quit = QtWidgets.QPushButton("&Quit")
-        quit.setFont(QtGui.QFont("Times", 18, QtGui.QFont.Bold))
+        quit.setFont(quit_font())
         quit.clicked.connect(QtWidgets.QApplication.quit)
 
         angle = LCDRange()
@@ -1,10 +1,11 @@
 import os
-import copy
 from PySide2.QtSql import QSqlRelationalDelegate
-from PySide2.QtWidgets import (QItemDelegate, QSpinBox, QStyledItemDelegate,
-                               QStyle, QStyleOptionViewItem)
-from PySide2.QtGui import QMouseEvent, QPixmap, QPalette, QImage
-from PySide2.QtCore import QEvent, QSize, Qt, QUrl
+from PySide2.QtWidgets import (QApplication, QItemDelegate, QSpinBox,
+                               QStyledItemDelegate, QStyle,
+                               QStyleOptionViewItem)
+from PySide2.QtGui import (QMouseEvent, QPixmap, QPalette, QImage, QPainter,
+                           QPixmapCache, QPen)
+from PySide2.QtCore import QEvent, QLine, QSize, Qt, QUrl, Slot
 
 
 
@@ -105,6 +106,59 @@ QWidget *BookDelegate::createEditor(QWidget *parent,
 
 """
 
+# Column layout of "select title, author, genre, year, rating from books".
+# The C++ example selects the id too, hence its year 4 / rating 5 checks.
+YEAR_COLUMN = 3
+RATING_COLUMN = 4
+
+
+def _paint_plain(painter, option, index, delegate):
+    # Since we draw the grid ourselves:
+    # copy through the C++ copy constructor, not the copy module
+    opt = QStyleOptionViewItem(option)
+    opt.rect = option.rect.adjusted(0, 0, -1, -1)
+    QSqlRelationalDelegate.paint(delegate, painter, opt, index)
+
+    # both grid lines share the bottom right corner; one draw call
+    rect = option.rect
+    corner = rect.bottomRight()
+    pen = painter.pen()
+    painter.setPen(delegate._grid_pen)
+    painter.drawLines([QLine(rect.bottomLeft(), corner),
+                       QLine(rect.topRight(), corner)])
+    painter.setPen(pen)
+
+
+def _make_paint_fn(mask):
+    """ Build the paint function specialized for one state mask.
+
+        mask bits: 1 rating column, 2 selected, 4 enabled, 8 active.
+        The colour group and selection are resolved here, once, so the
+        returned function carries no per cell branches.
+    """
+    if not mask & 1:
+        return _paint_plain
+
+    selected = bool(mask & 2)
+    if mask & 4:
+        color_group = QPalette.Normal if mask & 8 else QPalette.Inactive
+    else:
+        color_group = QPalette.Disabled
+
+    def paint_rating(painter, option, index, delegate):
+        rating = index.model().data(index, Qt.DisplayRole)
+        cell = delegate._rating_cell(option, rating, selected, color_group)
+        painter.drawPixmap(option.rect.topLeft(), cell)
+
+        # Since we draw the grid ourselves:
+        delegate.drawFocus(painter, option, option.rect.adjusted(0, 0, -1, -1))
+
+    return paint_rating
+
+
+# one paint function per state mask, indexed by the mask itself
+_PAINT_FNS = tuple(_make_paint_fn(mask) for mask in range(16))
+
 
 class BookDelegate(QSqlRelationalDelegate):
     """Books delegate to rate the books"""
@@ -113,8 +167,67 @@ class BookDelegate(QSqlRelationalDelegate):
         QSqlRelationalDelegate.__init__(self, parent)
         #print(os.path.dirname(__file__))
         star_png = os.path.dirname(__file__) + "/images/star.png"
-        self.star = QPixmap(star_png)
+        image = QImage(star_png)
+        # star metrics never change; avoid a C++ call for them per cell
+        self._sw = image.width()
+        self._sh = image.height()
+        self._size_hint = QSize(5 * self._sw + 1, self._sh + 1)
+        # every row fits one star plus the grid line; views can fix their
+        # row height to this and skip per-row sizeHint queries
+        self.row_height = self._sh + 1
+        # Match the screen once so the raster engine never rescales the
+        # star (or the pixmaps built from it) on a HiDPI paint.
+        # NB: a view dragged onto a screen with another ratio keeps these
+        self._dpr = QApplication.primaryScreen().devicePixelRatio()
+        if self._dpr != 1:
+            image = image.scaled(image.size() * self._dpr, Qt.IgnoreAspectRatio,
+                                 Qt.SmoothTransformation)
+        # premultiplied ARGB32 is the raster engines native blending format;
+        # convert once here rather than on every blit of the star
+        image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+        star = QPixmap.fromImage(image)
+        star.setDevicePixelRatio(self._dpr)
+        self.star = star
+        self._rating_pix = self._build_rating_pixmaps()
+
+        # grid pen built once, and only rebuilt when the palette changes
+        self._grid_pen = QPen()
+        self._update_grid_pen(QApplication.palette())
+        QApplication.instance().paletteChanged.connect(self._update_grid_pen)
+
+        self._paint_fns = _PAINT_FNS
+
+    @Slot(QPalette)
+    def _update_grid_pen(self, palette):
+        self._grid_pen = QPen(palette.color(QPalette.Mid))
+
+    def _new_pixmap(self, width, height):
+        """ A transparent pixmap of logical size width x height at the
+            screen device pixel ratio.
+        """
+        pixmap = QPixmap(QSize(width, height) * self._dpr)
+        pixmap.setDevicePixelRatio(self._dpr)
+        pixmap.fill(Qt.transparent)
+        return pixmap
 
+    def _build_rating_pixmaps(self):
+        """ Pre-render one 5 star wide strip per rating 0..5.
+
+            paint() then blits a whole rating with a single drawPixmap
+            call rather than one call per star.
+        """
+        width = self._sw
+        height = self._sh
+        rating_pix = []
+        for rating in range(6):
+            strip = self._new_pixmap(5 * width, height)
+            if rating:
+                # let the raster engine repeat the star across the rating
+                painter = QPainter(strip)
+                painter.drawTiledPixmap(0, 0, rating * width, height, self.star)
+                painter.end()
+            rating_pix.append(strip)
+        return rating_pix
 
     def paint(self, painter, option, index):
         """ Paint the items in the table.
@@ -127,68 +240,76 @@ class BookDelegate(QSqlRelationalDelegate):
             the column number to find out if we needed to paint the
             stars, but it works for the purposes of this example.
         """
-        if index.column() != 4:
-            # Since we draw the grid ourselves:
-            opt = copy.copy(option)
-            opt.rect = option.rect.adjusted(0, 0, -1, -1)
-            QSqlRelationalDelegate.paint(self, painter, opt, index)
-        else:
-            model = index.model()
-            if option.state & QStyle.State_Enabled:
-                if option.state & QStyle.State_Active:
-                    color_group = QPalette.Normal
-                else:
-                    color_group = QPalette.Inactive
-            else:
-                color_group = QPalette.Disabled
-
-            if option.state & QStyle.State_Selected:
-                painter.fillRect(option.rect,
-                                 option.palette.color(color_group, QPalette.Highlight))
-
-            rating = model.data(index, Qt.DisplayRole)
-            width = self.star.width()
-            height = self.star.height()
-            x = option.rect.x()
-            y = option.rect.y() + (option.rect.height() / 2) - (height / 2)
-            for i in range(rating):
-                painter.drawPixmap(x, y, self.star)
-                x += width
-
-            # Since we draw the grid ourselves:
-            self.drawFocus(painter, option, option.rect.adjusted(0, 0, -1, -1))
-
-        pen = painter.pen()
-        painter.setPen(option.palette.color(QPalette.Mid))
-        painter.drawLine(option.rect.bottomLeft(), option.rect.bottomRight())
-        painter.drawLine(option.rect.topRight(), option.rect.bottomRight())
-        painter.setPen(pen)
+        state = option.state
+        mask = ((index.column() == RATING_COLUMN)
+                | bool(state & QStyle.State_Selected) << 1
+                | bool(state & QStyle.State_Enabled) << 2
+                | bool(state & QStyle.State_Active) << 3)
+        self._paint_fns[mask](painter, option, index, self)
+
+    def _rating_cell(self, option, rating, selected, color_group):
+        """ Return the composited rating cell from the QPixmapCache.
+
+            The selection fill, star strip and grid lines only depend on
+            the key below, so each distinct cell is painted once and every
+            later paint() of it is a single drawPixmap.
+        """
+        width = option.rect.width()
+        height = option.rect.height()
+        key = "book:{}:{}:{}:{}:{}x{}".format(
+            rating, int(selected), int(color_group),
+            option.palette.cacheKey(), width, height)
+
+        cell = QPixmap()
+        if QPixmapCache.find(key, cell):
+            return cell
+
+        cell = self._new_pixmap(width, height)
+        painter = QPainter(cell)
+        if selected:
+            painter.fillRect(0, 0, width, height,
+                             option.palette.color(color_group, QPalette.Highlight))
+
+        y = (height // 2) - (self._sh // 2)
+        painter.drawPixmap(0, y, self._rating_pix[rating])
+
+        painter.setPen(self._grid_pen)
+        painter.drawLines([QLine(0, height - 1, width - 1, height - 1),
+                           QLine(width - 1, 0, width - 1, height - 1)])
+        painter.end()
+
+        QPixmapCache.insert(key, cell)
+        return cell
 
     def sizeHint(self, option, index):
         """ Returns the size needed to display the item in a QSize object. """
-        if index.column() == 5:
-            size_hint = QSize(5 * self.star.width(), self.star.height()) + QSize(1, 1)
-            return size_hint
+        if index.column() == RATING_COLUMN:
+            return self._size_hint
         # Since we draw the grid ourselves:
         return QSqlRelationalDelegate.sizeHint(self, option, index) + QSize(1, 1)
 
     def editorEvent(self, event, model, option, index):
-        if index.column() != 4:
-            return False
-
-        if event.type() == QEvent.MouseButtonPress:
-            mouse_pos = event.pos()
-            new_stars = int(0.7 + (mouse_pos.x() - option.rect.x()) / self.star.width())
-            stars = max(0, min(new_stars, 5))
-            model.setData(index, stars)
-            # So that the selection can change
-            return False
-
-        return True
+        # Most events are moves/hovers/keys; settle those first. The rating
+        # column consumes them (it has no editor), the rest go to the base.
+        if event.type() != QEvent.MouseButtonPress:
+            if index.column() == RATING_COLUMN:
+                return True
+            return QSqlRelationalDelegate.editorEvent(self, event, model,
+                                                      option, index)
+
+        if index.column() != RATING_COLUMN:
+            return QSqlRelationalDelegate.editorEvent(self, event, model,
+                                                      option, index)
+
+        mouse_pos = event.pos()
+        new_stars = int(0.7 + (mouse_pos.x() - option.rect.x()) / self._sw)
+        stars = max(0, min(new_stars, 5))
+        model.setData(index, stars)
+        # So that the selection can change
+        return False
 
     def createEditor(self, parent, option, index):
-        print(index.column())
-        if index.column() != 4:
+        if index.column() != YEAR_COLUMN:
             return QSqlRelationalDelegate.createEditor(self, parent, option, index)
 
         # For editing the year, return a spinbox with a range from -1000 to 2100.
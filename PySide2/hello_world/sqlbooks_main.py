@@ -2,11 +2,12 @@
 import sys
 
 from PySide2.QtCore import Qt
-from PySide2.QtSql import QSqlQueryModel
-from PySide2.QtWidgets import QTableView, QApplication
+from PySide2.QtGui import QPixmapCache
+from PySide2.QtWidgets import QTableView, QApplication, QHeaderView
 
 import sqlbooks_createDB
 from sqlbooks_delegate import BookDelegate
+from sqlbooks_model import CachedQueryModel
 
 
 """
@@ -30,10 +31,13 @@ if __name__ == "__main__":
     app = QApplication()
     app.setApplicationName("Setting a Window Title When we are just showing a Widget")
 
+    # room for the delegates composited rating cells (limit is in KB)
+    QPixmapCache.setCacheLimit(20 * 1024)
+
     # create the db from records initialized in sqlbooks_createDB module
     sqlbooks_createDB.init_db()
 
-    model = QSqlQueryModel()
+    model = CachedQueryModel()
     #model.setQuery("select * from books")
     #model.setQuery("select * from authors")
     #model.setQuery("select * from genres")
@@ -48,7 +52,14 @@ if __name__ == "__main__":
 
     table_view = QTableView()
     table_view.setModel(model)
-    table_view.setItemDelegate(BookDelegate())
+    delegate = BookDelegate()
+    table_view.setItemDelegate(delegate)
+    # uniform fixed rows, tall enough for the star strip as well as the
+    # style's default text row (and the year spinbox editor)
+    vertical_header = table_view.verticalHeader()
+    vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+    vertical_header.setDefaultSectionSize(
+        max(delegate.row_height, vertical_header.defaultSectionSize()))
     table_view.resize(800, 600)
     table_view.show()
     sys.exit(app.exec_())
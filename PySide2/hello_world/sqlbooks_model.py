@@ -0,0 +1,71 @@
+from PySide2.QtCore import QModelIndex, Qt, Slot
+from PySide2.QtSql import QSqlQueryModel
+
+
+"""
+The view calls data() for every role (display, decoration, font, alignment,
+colours, size hint ...) of every visible cell on every repaint, and each call
+turns an sqlite record value into a QVariant. The table is read only, so the
+answers only change when the model is reset or told its data changed; until
+then they can be served straight from python.
+
+Display/Edit values are copied into a list of row tuples as the rows arrive:
+QSqlQueryModel already fetches lazily in batches as the view scrolls, so
+following its rowsInserted keeps the copy in step with the fetched window.
+Every other role is memoized per (row, column, role) on first request.
+"""
+
+_MISS = object()
+
+_ROW_ROLES = (Qt.DisplayRole, Qt.EditRole)
+
+
+class CachedQueryModel(QSqlQueryModel):
+    """Read only query model serving data() from python side caches"""
+
+    def __init__(self, parent=None):
+        QSqlQueryModel.__init__(self, parent)
+        self._cache = {}
+        self._rows = []
+        self.modelReset.connect(self._clear_cache)
+        self.dataChanged.connect(self._clear_cache)
+        self.layoutChanged.connect(self._clear_cache)
+        self.modelReset.connect(self._reload_rows)
+        self.rowsInserted.connect(self._load_rows)
+
+    @Slot()
+    def _clear_cache(self, *args):
+        self._cache.clear()
+
+    @Slot()
+    def _reload_rows(self):
+        self._rows = []
+        self._load_rows(QModelIndex(), 0, self.rowCount() - 1)
+
+    @Slot(QModelIndex, int, int)
+    def _load_rows(self, parent, first, last):
+        """ Copy the values of the newly fetched rows first..last """
+        columns = range(self.columnCount())
+        rows = []
+        for row in range(first, last + 1):
+            record = self.record(row)
+            rows.append(tuple(record.value(column) for column in columns))
+        # insert where Qt says the rows went rather than assume they are
+        # always appended; rows below an insert shift, so do their memos
+        if first < len(self._rows):
+            self._cache.clear()
+        self._rows[first:first] = rows
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if role in _ROW_ROLES:
+            return self._rows[index.row()][index.column()]
+
+        key = (index.row(), index.column(), role)
+        value = self._cache.get(key, _MISS)
+        if value is _MISS:
+            value = QSqlQueryModel.data(self, index, role)
+            self._cache[key] = value
+        return value
@@ -1,9 +1,9 @@
 
 import sys
-import urllib2
 
 from PySide2 import QtGui
 from PySide2 import QtCore
+from PySide2 import QtNetwork
 from PySide2 import QtWidgets
 
 #------------------------------------------------------------------------------
@@ -21,23 +21,12 @@ from PySide2 import QtWidgets
 # provide signals and slots
 #
 # QThread can run and event loop, and provides thread safe signals and slots
-
-
-# Worker Thread
-class DownloadThread(QtCore.QThread):
-
-    data_downloaded = QtCore.Signal(object)
-
-    def __init__(self, url):
-        QtCore.QThread.__init__(self)
-        # initialize where the work is to be done
-        self.url = url
-
-    def run(self):
-        # do the work, ie download some data from the initialized url
-        info = urllib2.urlopen(self.url).info()
-        # once we get it, emit a signal about it along with some data
-        self.data_downloaded.emit('%s\n%s' % (self.url, info))
+#
+# For network IO neither is needed though: a QNetworkAccessManager issues
+# requests asynchronously and multiplexes all of them on the gui threads own
+# event loop, emitting finished(QNetworkReply) as each one completes. So no
+# worker threads are created at all, and the reply is already in the main
+# thread where it is safe to touch the QListWidget.
 
 
 # Main GUI Thread
@@ -52,24 +41,56 @@ class MainWindow(QtWidgets.QWidget):
         layout.addWidget(self.list_widget)
         self.setLayout(layout)
 
+        # one manager serves every request
+        self.nam = QtNetwork.QNetworkAccessManager(self)
+        self.nam.finished.connect(self.on_reply)
+
+        # replies arriving within 100ms of each other are added in one go,
+        # so the list relayouts once per batch rather than once per reply
+        self._pending = []
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(100)
+        self._flush_timer.timeout.connect(self._flush_pending)
+
     def start_download(self):
         urls = ['http://google.com', 'http://twitter.com', 'http://yandex.ru',
                 'http://stackoverflow.com/', 'http://www.youtube.com/']
 
-        self.threads = []
         for url in urls:
-            # create a worker thread
-            downloader = DownloadThread(url)
-            # connect the workers 'done' signal to a gui handler
-            downloader.data_downloaded.connect(self.on_data_ready)
-            # track the threads
-            self.threads.append(downloader)
-            # execute the thread
-            downloader.start()
+            request = QtNetwork.QNetworkRequest(QtCore.QUrl(url))
+            # urlopen followed redirects, a Qt5 manager does not by default
+            request.setAttribute(
+                QtNetwork.QNetworkRequest.FollowRedirectsAttribute, True)
+            self.nam.get(request)
+
+    @QtCore.Slot(QtNetwork.QNetworkReply)
+    def on_reply(self, reply):
+        # the headers alone, as urlopen().info() used to provide; http
+        # headers are latin-1 on the wire, so any byte decodes
+        try:
+            if reply.error() != QtNetwork.QNetworkReply.NoError:
+                self.on_data_ready('%s\nError: %s' % (
+                    reply.url().toString(), reply.errorString()))
+                return
+            info = '\n'.join(
+                '%s: %s' % (bytes(name).decode('latin-1'),
+                            bytes(value).decode('latin-1'))
+                for name, value in reply.rawHeaderPairs())
+            self.on_data_ready('%s\n%s' % (reply.url().toString(), info))
+        finally:
+            reply.deleteLater()
 
     def on_data_ready(self, data):
-        print data
-        self.list_widget.addItem(unicode(data))
+        print(data)
+        self._pending.append(data)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    @QtCore.Slot()
+    def _flush_pending(self):
+        self.list_widget.addItems(self._pending)
+        self._pending = []
 
 
 #------------------------------------------------------------------------------
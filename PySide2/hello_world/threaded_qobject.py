@@ -3,6 +3,11 @@ import random
 
 from PySide2 import QtWidgets, QtGui, QtCore
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 #------------------------------------------------------------------------------
 # Object/Worker Thread Example using QObject.moveTothread()
 # QtCore provides core infrastucture for Qt, it does not have any dependencies
@@ -13,6 +18,55 @@ from PySide2 import QtWidgets, QtGui, QtCore
 #     components such as buttons to create classic desktop-style UI,.
 
 
+# Trial division kernel. With numba available it compiles to a native int64
+# loop that also releases the GIL, so the gui keeps receiving status updates
+# while the worker thread grinds. Without numba it runs as plain python.
+def _trial_division(n, i):
+    factors = []
+    # not i * i <= n: compiled to int64 that square wraps negative once i
+    # passes 3037000499, and the loop would never end for a large prime n
+    while i <= n // i:
+        if n % i:
+            i += 1
+        else:
+            n //= i
+            factors.append(i)
+    if n > 1:
+        factors.append(n)
+    return factors
+
+
+if njit is not None:
+    _trial_division = njit(cache=True, nogil=True)(_trial_division)
+
+_INT64_MAX = 2**63 - 1
+
+
+def prime_factors(n, stopped=None):
+    """ Prime factors of n, ascending.
+
+    Values beyond int64 (5000**6 is one) have their small factors peeled
+    off in python until the remainder fits the kernel. That loop can run
+    for a long time, so it polls the optional stopped() callable and
+    returns None once it answers True.
+    """
+    factors = []
+    i = 2
+    while n > _INT64_MAX and i * i <= n:
+        if stopped is not None and not i & 0xFFFF and stopped():
+            return None
+        if n % i:
+            i += 1
+        else:
+            n //= i
+            factors.append(i)
+    if n > _INT64_MAX:
+        factors.append(n)  # nothing up to its square root divides it
+        return factors
+    factors.extend(_trial_division(n, i))
+    return factors
+
+
 class Example(QtCore.QObject):
     """ Example """
 
@@ -52,14 +106,24 @@ class Example(QtCore.QObject):
         self.gui.button_start.clicked.connect(self.worker.startWork)
 
 
-    def forceWorkerReset(self):
-        if self.worker_thread.isRunning():
+    def stopWorkerThread(self, grace=2000):
+        """ Ask the worker to stop and its thread to quit. Only if it has
+        not returned within grace msec (ie. stuck inside the compiled
+        kernel, which cannot poll) is the thread terminated.
+        """
+        self.worker.stop()
+        self.worker_thread.quit()
+        print('Waiting for thread to finish.')
+        if not self.worker_thread.wait(grace):
             print('Terminating thread.')
             self.worker_thread.terminate()
-
-            print('Waiting for thread termination.')
             self.worker_thread.wait()
 
+
+    def forceWorkerReset(self):
+        if self.worker_thread.isRunning():
+            self.stopWorkerThread()
+
             self.signalStatus.emit('Idle.')
 
             print('building new working object.')
@@ -68,8 +132,7 @@ class Example(QtCore.QObject):
 
     def forceWorkerQuit(self):
         if self.worker_thread.isRunning():
-            self.worker_thread.terminate()
-            self.worker_thread.wait()
+            self.stopWorkerThread()
 
 
 class WorkerObject(QtCore.QObject):
@@ -79,28 +142,32 @@ class WorkerObject(QtCore.QObject):
 
     def __init__(self, parent=None):
         super(self.__class__, self).__init__(parent)
+        self._stop = False
+
+    def stop(self):
+        """ Called directly from the gui thread while startWork() runs,
+        so not a queued slot; assigning a bool is atomic under the GIL
+        """
+        self._stop = True
+
+    def stopped(self):
+        return self._stop
 
     @QtCore.Slot()
     def startWork(self):
         for ii in range(7):
+            if self._stop:
+                return
             number = random.randint(0, 5000**ii)
             self.signalStatus.emit('Iteration: {}, Factoring: {}'.format(ii, number))
             factors = self.primeFactors(number)
+            if factors is None:
+                return
             print('Number: ', number, 'Factors: ', factors)
         self.signalStatus.emit('Idle.')
 
     def primeFactors(self, n):
-        i = 2
-        factors = []
-        while i * i <= n:
-            if n % i:
-                i += 1
-            else:
-                n //= i
-                factors.append(i)
-        if n > 1:
-            factors.append(n)
-        return factors
+        return prime_factors(n, self.stopped)
 
 
 class Window(QtWidgets.QWidget):
@@ -3,8 +3,6 @@ from PySide2.QtGui import *
 from PySide2.QtWidgets import *
 from PySide2.QtCore import *
 
-import time
-
 #------------------------------------------------------------------------------
 # processEvents() can return control back to Qt to accept more events while
 # we have a heavy logic block churning away. Sensible for progress bars,
@@ -19,6 +17,36 @@ import time
 # that the state of the app is being changed from OUTSIDE the loop. This gets
 # more unpredictable when there are multiple long running processes
 # THEREFORE THIS IS NOT A GOOD ALTERNATIVE TO THREADS
+#
+# So the loop now runs as a QRunnable on the QThreadPool instead; the gui
+# event loop is never re-entered, and each step reports back through a
+# signal which Qt queues onto the main thread to update the label.
+
+
+class WorkerSignals(QObject):
+    '''
+    QRunnable is not a QObject, so its signals live on a helper
+    '''
+    progress = Signal(str)
+
+
+class Worker(QRunnable):
+    '''
+    The 100 step loop formerly run inline by oh_no
+
+    :param message: callable returning the text to report each step
+    '''
+
+    def __init__(self, message):
+        super(Worker, self).__init__()
+        self.message = message
+        self.signals = WorkerSignals()
+
+    @Slot()
+    def run(self):
+        for n in range(100):
+            QThread.msleep(100)
+            self.signals.progress.emit(self.message())
 
 
 class MainWindow(QMainWindow):
@@ -45,16 +73,17 @@ class MainWindow(QMainWindow):
 
         self.show()
 
+        self.threadpool = QThreadPool()
+
     def change_message(self):
         self.message = "OH NO"
 
     def oh_no(self):
         self.message = "Pressed"
 
-        for n in range(100):
-            time.sleep(0.1)
-            self.l_start.setText(self.message)
-            QApplication.processEvents()
+        worker = Worker(lambda: self.message)
+        worker.signals.progress.connect(self.l_start.setText)
+        self.threadpool.start(worker)
 
 
 #------------------------------------------------------------------------------
@@ -1,8 +1,9 @@
-from PySide2.QtGui import *
-from PySide2.QtWidgets import *
-from PySide2.QtCore import *
+from PySide2.QtWidgets import (QApplication, QLabel, QMainWindow,
+                               QPushButton, QVBoxLayout, QWidget)
+from PySide2.QtCore import QRunnable, QThreadPool, QTimer, Slot
 
 import time
+import functools
 
 #------------------------------------------------------------------------------
 # Passing custom data into the execution function is done via __init__()
@@ -25,10 +26,10 @@ class Worker(QRunnable):
 
     def __init__(self, fn, *args, **kwargs):
         super(Worker, self).__init__()
-        # Store constructor arguments (re-used for processing)
+        # Bind the constructor arguments once, rather than unpacking
+        # args/kwargs again on every run
         self.fn = fn
-        self.args = args
-        self.kwargs = kwargs
+        self._invoke = functools.partial(fn, *args, **kwargs)
 
         self.name = args[0]
         self.num = kwargs["thread_num"]
@@ -38,7 +39,7 @@ class Worker(QRunnable):
         '''
         Initialise the runner function with passed args, kwargs.
         '''
-        self.fn(*self.args, **self.kwargs)
+        self._invoke()
 
 
 class MainWindow(QMainWindow):
@@ -48,10 +49,18 @@ class MainWindow(QMainWindow):
         super(MainWindow, self).__init__(*args, **kwargs)
 
         self.counter = 0
+        self._counter_prefix = "Counter: "
         self.thread_count = 0
 
         # Manage a pool of threads to feed QRunnables
         self.threadpool = QThreadPool()
+        # The callbacks here sleep rather than compute, so keep Qt's default
+        # thread count but never expire idle threads; recreating them costs
+        # more than parking them. CPU bound callbacks would instead cap the
+        # pool (setMaxThreadCount) at the number of physical cores, roughly
+        # half of QThread.idealThreadCount() on hyperthreaded machines, to
+        # avoid oversubscription
+        self.threadpool.setExpiryTimeout(-1)
         print("Multithreading with maximum %d threads" % self.threadpool.maxThreadCount())
 
         layout = QVBoxLayout()
@@ -96,7 +105,7 @@ class MainWindow(QMainWindow):
 
     def recurring_timer(self):
         self.counter += 1
-        self.l_start.setText("Counter: %d" % self.counter)
+        self.l_start.setText(self._counter_prefix + str(self.counter))
 
 
 #------------------------------------------------------------------------------
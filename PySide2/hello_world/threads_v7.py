@@ -1,11 +1,15 @@
-from PySide2.QtGui import *
-from PySide2.QtWidgets import *
-from PySide2.QtCore import *
+from PySide2.QtWidgets import (QApplication, QLabel, QMainWindow,
+                               QPushButton, QVBoxLayout, QWidget)
+from PySide2.QtCore import (QObject, QRunnable, QThread, QTimer, Qt, Signal,
+                            Slot)
 
 import sys
 import time
 import traceback
 import random
+import functools
+import threading
+from collections import deque
 
 #------------------------------------------------------------------------------
 # Custom Signals can only be defined on objects derived from QObject
@@ -56,11 +60,33 @@ class Worker(QRunnable):
 
     def __init__(self, fn, *args, **kwargs):
         super(Worker, self).__init__()
-        # Store constructor arguments (re-used for processing)
-        self.fn = fn
-        self.args = args
-        self.kwargs = kwargs
         self.signals = WorkerSignals()
+        self.reset(fn, *args, **kwargs)
+        # only format tracebacks for the error signal if someone listens
+        self._has_error_sub = False
+
+    def reset(self, fn, *args, **kwargs):
+        '''
+        Rebind the callback and its arguments so a finished worker can be
+        reused, keeping its signals object and connections
+        '''
+        self.fn = fn
+        # Bind the arguments and the status/progress signals once rather
+        # than unpacking args/kwargs again on every run
+        self._invoke = functools.partial(
+            fn, *args,
+            status=self.signals.status,
+            progress=self.signals.progress,
+            **kwargs
+        )
+
+    def connect_error(self, slot, *args):
+        '''
+        Connect slot to signals.error; use this rather than connecting the
+        signal directly so run() knows the traceback is wanted
+        '''
+        self.signals.error.connect(slot, *args)
+        self._has_error_sub = True
 
     @Slot()  # QtCore.Slot
     def run(self):
@@ -68,34 +94,156 @@ class Worker(QRunnable):
         Initialise the runner function with passed args, kwargs.
         '''
 
-        # Retrieve args/kwargs here; and fire processing using them
-        # NB: **kwargs must be last, *args must be second to last
         try:
-            result = self.fn(
-                status=self.signals.status,
-                progress=self.signals.progress,
-                *self.args, **self.kwargs
-            )
+            result = self._invoke()
         except Exception as e:
-            traceback.print_exc()
-            exctype, value = sys.exc_info()[:2]
-            self.signals.error.emit((exctype, value, traceback.format_exc()))
+            if self._has_error_sub:
+                # format once; reporting it is now the subscribers job
+                exctype, value = sys.exc_info()[:2]
+                self.signals.error.emit((exctype, value, traceback.format_exc()))
+            else:
+                traceback.print_exc()
         else:
             self.signals.result.emit(result)  # Return the result of the processing
         finally:
             self.signals.finished.emit()  # Done
 
 
+class WorkStealingPool(object):
+    '''
+    Work stealing executor for QRunnables
+
+    Every worker thread owns a deque: it pops its own newest task from the
+    right, and once that runs dry it steals the oldest half of another
+    threads deque from the left. There is no shared queue and no lock to contend
+    on; single deque appends/pops are atomic under the GIL, so bursts of
+    uneven tasks rebalance themselves across the threads.
+
+    The only lock left is the wake up Event (a mutex + condition), and it is
+    kept off the hot path: an idle thread spins a few rounds yielding the GIL
+    before parking, and start() only signals when some thread is parked.
+
+    Runnables are run on plain python threads, so any gui updates must go
+    through their (queued) signals, exactly as with a QThreadPool.
+
+    :param num_threads: number of worker threads (and deques)
+    '''
+
+    # rounds an idle thread keeps looking for work before parking
+    SPIN = 64
+
+    def __init__(self, num_threads):
+        self._deques = [deque() for _ in range(num_threads)]
+        self._local = threading.local()
+        self._wake = threading.Event()
+        self._parked = set()
+        self._next = 0
+        for i in range(num_threads):
+            thread = threading.Thread(target=self._work, args=(i,),
+                                      name="WorkStealingPool-%d" % i)
+            thread.daemon = True
+            thread.start()
+
+    def maxThreadCount(self):
+        return len(self._deques)
+
+    def start(self, runnable):
+        '''
+        Queue a runnable; on the submitting workers own deque when called
+        from a pool thread, otherwise (ie. the gui) dealt round robin
+        '''
+        own = getattr(self._local, 'deque', None)
+        if own is None:
+            own = self._deques[self._next]
+            self._next = (self._next + 1) % len(self._deques)
+        own.append(runnable)
+        if self._parked:
+            self._wake.set()
+
+    def start_batch(self, runnables):
+        '''
+        Queue a burst of runnables at once: each deque gets its share with
+        a single extend (one C level call rather than an append per task)
+        and the parked threads are woken once for the whole batch
+        '''
+        runnables = list(runnables)
+        count = len(self._deques)
+        for i, own in enumerate(self._deques):
+            own.extend(runnables[i::count])
+        if self._parked:
+            self._wake.set()
+
+    def _steal(self, i):
+        '''
+        Take the oldest half of the first non empty victim deque: one task to
+        run now, the rest onto our own deque, so a burst dumped on one thread
+        is rebalanced in a few steals rather than one probe per task
+        '''
+        mine = self._deques[i]
+        victims = len(self._deques)
+        first = random.randrange(victims)
+        for offset in range(victims):
+            victim = self._deques[(first + offset) % victims]
+            if victim is mine:
+                continue
+            # the victim may drain while we take, so stop at the first miss
+            task = None
+            try:
+                task = victim.popleft()
+                for _ in range(len(victim) // 2):
+                    mine.append(victim.popleft())
+            except IndexError:
+                pass
+            if task is not None:
+                return task
+        return None
+
+    def _work(self, i):
+        mine = self._deques[i]
+        self._local.deque = mine
+        idle = 0
+        while True:
+            try:
+                task = mine.pop()
+            except IndexError:
+                task = self._steal(i)
+            if task is not None:
+                idle = 0
+                task.run()
+                continue
+            idle += 1
+            if idle < self.SPIN:
+                time.sleep(0)  # yield the GIL to whoever is producing
+                continue
+            # register and clear before the last look so a start() racing
+            # with it still wakes us
+            self._parked.add(i)
+            self._wake.clear()
+            if not any(self._deques):
+                self._wake.wait()
+            self._parked.discard(i)
+            idle = 0
+
+
 class MainWindow(QMainWindow):
 
+    # workers queued at once by the burst button
+    BURST = 10
+
     def __init__(self, *args, **kwargs):
         super(MainWindow, self).__init__(*args, **kwargs)
 
         self.counter = 0
+        self._counter_prefix = "Counter: "
         self.thread_count = 0
+        # finished workers waiting to be reused by make_worker
+        self._worker_pool = []
 
         # Handle queing and execution of QRunnable worker threads
-        self.threadpool = QThreadPool()
+        # One deque per hardware thread with idle threads stealing from busy
+        # ones, rather than fixed shards where a long task strands the work
+        # queued behind it while other threads sit idle
+        self.threadpool = WorkStealingPool(QThread.idealThreadCount())
         print("Multithreading with maximum %d threads" % self.threadpool.maxThreadCount())
 
         layout = QVBoxLayout()
@@ -103,9 +251,12 @@ class MainWindow(QMainWindow):
         self.l_start = QLabel("Start")
         b_danger = QPushButton("DANGER!")
         b_danger.pressed.connect(self.oh_no)
+        b_burst = QPushButton("DANGER x%d!" % self.BURST)
+        b_burst.pressed.connect(self.oh_no_burst)
 
         layout.addWidget(self.l_start)
         layout.addWidget(b_danger)
+        layout.addWidget(b_burst)
 
         w = QWidget()
         w.setLayout(layout)
@@ -131,26 +282,70 @@ class MainWindow(QMainWindow):
         # function, emitted once the function has returned
         return "Done. Slept for {} seconds".format(number)
 
+    @Slot(object)
     def print_output(self, s):
         print(s)
 
+    @Slot(tuple)
+    def print_error(self, error):
+        exctype, value, tb = error
+        sys.stderr.write(tb)
+
+    @Slot()
     def thread_complete(self):
         print("THREAD COMPLETE!")
 
-    def oh_no(self):
+    def make_worker(self, fn, *args, **kwargs):
+        '''
+        Worker for fn, with its result/finished/error signals connected
+        '''
         # Pass the function to execute
         # Any other args, kwargs are passed to the run function
 
-        worker = Worker(self.execute_this_fn)
-        worker.signals.result.connect(self.print_output)
-        worker.signals.finished.connect(self.thread_complete)
+        # Recycle a finished worker when there is one; its WorkerSignals
+        # QObject and connections carry over, so only new workers connect
+        if self._worker_pool:
+            worker = self._worker_pool.pop()
+            worker.reset(fn, *args, **kwargs)
+        else:
+            worker = Worker(fn, *args, **kwargs)
+            # always emitted from a pool thread, so pin the queued delivery
+            # rather than have each emit work out the connection type
+            worker.signals.result.connect(self.print_output, Qt.QueuedConnection)
+            worker.signals.finished.connect(self.thread_complete, Qt.QueuedConnection)
+            worker.connect_error(self.print_error, Qt.QueuedConnection)
+            # queued, so the pool is only ever touched from the gui thread
+            worker.signals.finished.connect(
+                lambda worker=worker: self._worker_pool.append(worker),
+                Qt.QueuedConnection
+            )
+        return worker
+
+    @Slot()
+    def oh_no(self):
+        worker = self.make_worker(self.execute_this_fn)
 
         # Execute
         self.threadpool.start(worker)
+        self.thread_count += 1
+
+    @Slot()
+    def oh_no_burst(self):
+        self.submit_batch(
+            self.make_worker(self.execute_this_fn) for _ in range(self.BURST))
+
+    def submit_batch(self, workers):
+        '''
+        Start a burst of workers with one bulk insert into the pool
+        '''
+        workers = list(workers)
+        self.threadpool.start_batch(workers)
+        self.thread_count += len(workers)
 
+    @Slot()
     def recurring_timer(self):
         self.counter += 1
-        self.l_start.setText("Counter: %d" % self.counter)
+        self.l_start.setText(self._counter_prefix + str(self.counter))
 
 
 #------------------------------------------------------------------------------
@@ -2,6 +2,12 @@
 
 # 
 #  % pyside2-uic mixer.ui > ui_mixer.py
+#
+#  optionally compile the generated form so setupUi's run of constant
+#  widget calls is dispatched from C; python imports the built
+#  ui_mixer.*.so ahead of this file, so mixer_main.py needs no change
+#  (rebuild after every pyside2-uic run, or delete the stale .so)
+#  % cythonize -i -3 ui_mixer.py
 #  
 
 ################################################################################
@@ -19,6 +25,28 @@ from PySide2.QtGui import (QBrush, QColor, QConicalGradient, QCursor, QFont,
     QRadialGradient)
 from PySide2.QtWidgets import *
 
+# hand edited: the repeated construct/name/place sequences are driven
+# from these tables; (name, source text, row) and (name, text, row, column)
+# rows are kept in the generated creation order
+_LABELS = (
+    ("label", u"Tequila", 0),
+    ("label_2", u"Triple Sec", 1),
+    ("label_3", u"Lime Juice", 2),
+    ("label_4", u"Ice", 3),
+)
+
+_SPEED_BUTTONS = (
+    ("speedButton1", u"&Mix", 0, 0),
+    ("speedButton3", u"&Puree", 0, 2),
+    ("speedButton4", u"&Chop", 1, 0),
+    ("speedButton5", u"&Karate Chop", 1, 1),
+    ("speedButton6", u"&Beat", 1, 2),
+    ("speedButton9", u"&Vaporize", 3, 2),
+    ("speedButton8", u"&Liquefy", 3, 1),
+    ("speedButton7", u"&Smash", 3, 0),
+    ("speedButton2", u"&Whip", 0, 1),
+)
+
 
 class Ui_MargaritaMixer(object):
     def setupUi(self, MargaritaMixer):
@@ -27,15 +55,11 @@ class Ui_MargaritaMixer(object):
         MargaritaMixer.resize(536, 368)
         self.gridLayout = QGridLayout(MargaritaMixer)
         self.gridLayout.setObjectName(u"gridLayout")
-        self.label = QLabel(MargaritaMixer)
-        self.label.setObjectName(u"label")
-
-        self.gridLayout.addWidget(self.label, 0, 0, 1, 1)
-
-        self.label_2 = QLabel(MargaritaMixer)
-        self.label_2.setObjectName(u"label_2")
-
-        self.gridLayout.addWidget(self.label_2, 1, 0, 1, 1)
+        for name, text, row in _LABELS:
+            label = QLabel(MargaritaMixer)
+            label.setObjectName(name)
+            self.gridLayout.addWidget(label, row, 0, 1, 1)
+            setattr(self, name, label)
 
         self.tripleSecSpinBox = QSpinBox(MargaritaMixer)
         self.tripleSecSpinBox.setObjectName(u"tripleSecSpinBox")
@@ -44,21 +68,11 @@ class Ui_MargaritaMixer(object):
 
         self.gridLayout.addWidget(self.tripleSecSpinBox, 1, 2, 1, 1)
 
-        self.label_3 = QLabel(MargaritaMixer)
-        self.label_3.setObjectName(u"label_3")
-
-        self.gridLayout.addWidget(self.label_3, 2, 0, 1, 1)
-
         self.limeJuiceLineEdit = QLineEdit(MargaritaMixer)
         self.limeJuiceLineEdit.setObjectName(u"limeJuiceLineEdit")
 
         self.gridLayout.addWidget(self.limeJuiceLineEdit, 2, 1, 1, 2)
 
-        self.label_4 = QLabel(MargaritaMixer)
-        self.label_4.setObjectName(u"label_4")
-
-        self.gridLayout.addWidget(self.label_4, 3, 0, 1, 1)
-
         self.iceHorizontalSlider = QSlider(MargaritaMixer)
         self.iceHorizontalSlider.setObjectName(u"iceHorizontalSlider")
         self.iceHorizontalSlider.setMinimum(0)
@@ -89,63 +103,16 @@ class Ui_MargaritaMixer(object):
         self.groupBox.setObjectName(u"groupBox")
         self.gridLayout_2 = QGridLayout(self.groupBox)
         self.gridLayout_2.setObjectName(u"gridLayout_2")
-        self.speedButton1 = QRadioButton(self.groupBox)
         self.speedButtonGroup = QButtonGroup(MargaritaMixer)
         self.speedButtonGroup.setObjectName(u"speedButtonGroup")
-        self.speedButtonGroup.addButton(self.speedButton1)
-        self.speedButton1.setObjectName(u"speedButton1")
-
-        self.gridLayout_2.addWidget(self.speedButton1, 0, 0, 1, 1)
-
-        self.speedButton3 = QRadioButton(self.groupBox)
-        self.speedButtonGroup.addButton(self.speedButton3)
-        self.speedButton3.setObjectName(u"speedButton3")
-
-        self.gridLayout_2.addWidget(self.speedButton3, 0, 2, 1, 1)
-
-        self.speedButton4 = QRadioButton(self.groupBox)
-        self.speedButtonGroup.addButton(self.speedButton4)
-        self.speedButton4.setObjectName(u"speedButton4")
-
-        self.gridLayout_2.addWidget(self.speedButton4, 1, 0, 1, 1)
-
-        self.speedButton5 = QRadioButton(self.groupBox)
-        self.speedButtonGroup.addButton(self.speedButton5)
-        self.speedButton5.setObjectName(u"speedButton5")
+        for name, text, row, column in _SPEED_BUTTONS:
+            button = QRadioButton(self.groupBox)
+            self.speedButtonGroup.addButton(button)
+            button.setObjectName(name)
+            self.gridLayout_2.addWidget(button, row, column, 1, 1)
+            setattr(self, name, button)
         self.speedButton5.setChecked(True)
 
-        self.gridLayout_2.addWidget(self.speedButton5, 1, 1, 1, 1)
-
-        self.speedButton6 = QRadioButton(self.groupBox)
-        self.speedButtonGroup.addButton(self.speedButton6)
-        self.speedButton6.setObjectName(u"speedButton6")
-
-        self.gridLayout_2.addWidget(self.speedButton6, 1, 2, 1, 1)
-
-        self.speedButton9 = QRadioButton(self.groupBox)
-        self.speedButtonGroup.addButton(self.speedButton9)
-        self.speedButton9.setObjectName(u"speedButton9")
-
-        self.gridLayout_2.addWidget(self.speedButton9, 3, 2, 1, 1)
-
-        self.speedButton8 = QRadioButton(self.groupBox)
-        self.speedButtonGroup.addButton(self.speedButton8)
-        self.speedButton8.setObjectName(u"speedButton8")
-
-        self.gridLayout_2.addWidget(self.speedButton8, 3, 1, 1, 1)
-
-        self.speedButton7 = QRadioButton(self.groupBox)
-        self.speedButtonGroup.addButton(self.speedButton7)
-        self.speedButton7.setObjectName(u"speedButton7")
-
-        self.gridLayout_2.addWidget(self.speedButton7, 3, 0, 1, 1)
-
-        self.speedButton2 = QRadioButton(self.groupBox)
-        self.speedButtonGroup.addButton(self.speedButton2)
-        self.speedButton2.setObjectName(u"speedButton2")
-
-        self.gridLayout_2.addWidget(self.speedButton2, 0, 1, 1, 1)
-
 
         self.gridLayout.addWidget(self.groupBox, 4, 0, 1, 3)
 
@@ -164,39 +131,33 @@ class Ui_MargaritaMixer(object):
     # setupUi
 
     def retranslateUi(self, MargaritaMixer):
-        MargaritaMixer.setWindowTitle(QCoreApplication.translate("MargaritaMixer", u"Margarita Mixer", None))
-        self.label.setText(QCoreApplication.translate("MargaritaMixer", u"Tequila", None))
-        self.label_2.setText(QCoreApplication.translate("MargaritaMixer", u"Triple Sec", None))
+        # hand edited: bind translate and its context once per call
+        tr = QCoreApplication.translate
+        ctx = "MargaritaMixer"
+        MargaritaMixer.setWindowTitle(tr(ctx, u"Margarita Mixer", None))
 #if QT_CONFIG(tooltip)
-        self.tripleSecSpinBox.setToolTip(QCoreApplication.translate("MargaritaMixer", u"Jiggers of triple sec", None))
+        self.tripleSecSpinBox.setToolTip(tr(ctx, u"Jiggers of triple sec", None))
 #endif // QT_CONFIG(tooltip)
-        self.label_3.setText(QCoreApplication.translate("MargaritaMixer", u"Lime Juice", None))
 #if QT_CONFIG(tooltip)
-        self.limeJuiceLineEdit.setToolTip(QCoreApplication.translate("MargaritaMixer", u"Jiggers of lime juice", None))
+        self.limeJuiceLineEdit.setToolTip(tr(ctx, u"Jiggers of lime juice", None))
 #endif // QT_CONFIG(tooltip)
-        self.limeJuiceLineEdit.setText(QCoreApplication.translate("MargaritaMixer", u"12.0", None))
-        self.label_4.setText(QCoreApplication.translate("MargaritaMixer", u"Ice", None))
+        self.limeJuiceLineEdit.setText(tr(ctx, u"12.0", None))
 #if QT_CONFIG(tooltip)
-        self.iceHorizontalSlider.setToolTip(QCoreApplication.translate("MargaritaMixer", u"Chunks of ice", None))
+        self.iceHorizontalSlider.setToolTip(tr(ctx, u"Chunks of ice", None))
 #endif // QT_CONFIG(tooltip)
 #if QT_CONFIG(tooltip)
-        self.buttonBox.setToolTip(QCoreApplication.translate("MargaritaMixer", u"Press OK to make the drinks", None))
+        self.buttonBox.setToolTip(tr(ctx, u"Press OK to make the drinks", None))
 #endif // QT_CONFIG(tooltip)
 #if QT_CONFIG(tooltip)
-        self.tequilaScrollBar.setToolTip(QCoreApplication.translate("MargaritaMixer", u"Jiggers of tequila", None))
+        self.tequilaScrollBar.setToolTip(tr(ctx, u"Jiggers of tequila", None))
 #endif // QT_CONFIG(tooltip)
 #if QT_CONFIG(tooltip)
-        self.groupBox.setToolTip(QCoreApplication.translate("MargaritaMixer", u"Speed of the blender", None))
+        self.groupBox.setToolTip(tr(ctx, u"Speed of the blender", None))
 #endif // QT_CONFIG(tooltip)
-        self.groupBox.setTitle(QCoreApplication.translate("MargaritaMixer", u"Blender Speed", None))
-        self.speedButton1.setText(QCoreApplication.translate("MargaritaMixer", u"&Mix", None))
-        self.speedButton3.setText(QCoreApplication.translate("MargaritaMixer", u"&Puree", None))
-        self.speedButton4.setText(QCoreApplication.translate("MargaritaMixer", u"&Chop", None))
-        self.speedButton5.setText(QCoreApplication.translate("MargaritaMixer", u"&Karate Chop", None))
-        self.speedButton6.setText(QCoreApplication.translate("MargaritaMixer", u"&Beat", None))
-        self.speedButton9.setText(QCoreApplication.translate("MargaritaMixer", u"&Vaporize", None))
-        self.speedButton8.setText(QCoreApplication.translate("MargaritaMixer", u"&Liquefy", None))
-        self.speedButton7.setText(QCoreApplication.translate("MargaritaMixer", u"&Smash", None))
-        self.speedButton2.setText(QCoreApplication.translate("MargaritaMixer", u"&Whip", None))
+        self.groupBox.setTitle(tr(ctx, u"Blender Speed", None))
+        for name, text, row in _LABELS:
+            getattr(self, name).setText(tr(ctx, text, None))
+        for name, text, row, column in _SPEED_BUTTONS:
+            getattr(self, name).setText(tr(ctx, text, None))
     # retranslateUi
 
@@ -1,39 +1,56 @@
 import sys
 from PySide2 import QtCore, QtGui, QtWidgets
 
+# compiled once and shared by every Window; QRegularExpression is PCRE2,
+# optimize() JIT compiles the pattern up front instead of on first match
+_IPV4_RE = QtCore.QRegularExpression(r'^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$')
+_IPV4_RE.optimize()
 
-class RegExpValidator(QtGui.QRegExpValidator):
+
+class RegExpValidator(QtGui.QRegularExpressionValidator):
     validationChanged = QtCore.Signal(QtGui.QValidator.State)
 
+    def __init__(self, *args):
+        super(RegExpValidator, self).__init__(*args)
+        self._last_state = None
+
     def validate(self, input, pos):
         # python > 3
         #state, input, pos = super().validate(input, pos)
         # python < 3
         state, input, pos = super(RegExpValidator, self).validate(input, pos)
-        self.validationChanged.emit(state)
+        # only announce actual changes; every keystroke lands here
+        if state != self._last_state:
+            self._last_state = state
+            self.validationChanged.emit(state)
         return state, input, pos
 
 
 class Window(QtWidgets.QWidget):
+
+    STYLES = {
+        QtGui.QValidator.Invalid: 'border: 3px solid red',
+        QtGui.QValidator.Intermediate: 'border: 3px solid gold',
+        QtGui.QValidator.Acceptable: 'border: 3px solid lime',
+    }
+
     def __init__(self):
         super(Window, self).__init__()
-        regexp = QtCore.QRegExp(r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}')
-        validator = RegExpValidator(regexp, self)
+        validator = RegExpValidator(_IPV4_RE, self)
         validator.validationChanged.connect(self.handleValidationChange)
         self.edit = QtWidgets.QLineEdit()
         self.edit.setValidator(validator)
+        # one timer restarted on each change, not a new singleShot per change
+        self._reset_timer = QtCore.QTimer(self)
+        self._reset_timer.setSingleShot(True)
+        self._reset_timer.timeout.connect(lambda: self.edit.setStyleSheet(''))
         layout = QtWidgets.QVBoxLayout(self)
         layout.addWidget(self.edit)
 
+    @QtCore.Slot(QtGui.QValidator.State)
     def handleValidationChange(self, state):
-        if state == QtGui.QValidator.Invalid:
-            colour = 'red'
-        elif state == QtGui.QValidator.Intermediate:
-            colour = 'gold'
-        elif state == QtGui.QValidator.Acceptable:
-            colour = 'lime'
-        self.edit.setStyleSheet('border: 3px solid %s' % colour)
-        QtCore.QTimer.singleShot(1000, lambda: self.edit.setStyleSheet(''))
+        self.edit.setStyleSheet(self.STYLES[state])
+        self._reset_timer.start(1000)
 
 
 if __name__ == "__main__":
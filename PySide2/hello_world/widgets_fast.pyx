@@ -0,0 +1,32 @@
+# cython: language_level=3
+"""
+Compiled bodies for the LCDRange.setValue and CannonField.setAngle slots in
+slider_v4.py
+
+Only the slot bodies live here, as plain functions taking the widget as
+their first argument; the widgets themselves (and their @Slot
+declarations, which PySide2 only registers on python functions) stay in
+slider_v4.py, which calls these when the module has been built. The
+arguments are typed C ints, so the setAngle clamp runs as plain C
+comparisons with no boxing on each slider drag.
+
+Keep these in step with the python bodies in slider_v4.py, and rebuild
+after editing either (a stale build keeps running the old body).
+
+Build in place (produces widgets_fast.*.so next to this file):
+> cythonize -i widgets_fast.pyx
+"""
+
+
+def setValue(widget, int value):
+    widget.slider.setValue(value)
+
+
+def setAngle(widget, int angle):
+    cdef int current = widget.currentAngle
+    angle = 5 if angle < 5 else 70 if angle > 70 else angle
+    if current == angle:
+        return
+    widget.currentAngle = angle
+    widget.update()
+    widget.angleChanged.emit(angle)
@@ -1,15 +1,14 @@
 #!/usr/bin/env python
 
 import sys, os
-# the programs name is always the [0]th command line arg
-print(sys.argv)
-# dispose of it, and use pyside if any cl arg id provided
-sys.argv.pop()
 
-USE_PYSIDE = True if sys.argv else False
-# note expressions can be nested in f-strings so we can
-# use a ternary operator inside for cleaner debugging
-print(f"Using [{'PySide2' if USE_PYSIDE else 'PyQt5'}]")
+# pick the qt binding once at import time from the QT_API environment
+# variable (the same one qtpy and matplotlib honour), so a process only
+# ever loads one of the two bindings:
+# > QT_API=pyside2 ./main.py
+# sys.argv is left alone for QApplication, so Qt's own options such
+# as -style or -platform still reach it
+USE_PYSIDE = os.environ.get("QT_API", "pyqt5").lower() == "pyside2"
 if USE_PYSIDE:
     from PySide2 import QtWidgets
     from MainWindow2 import Ui_MainWindow
@@ -17,10 +16,8 @@ else:
     from PyQt5 import QtWidgets
     from MainWindow import Ui_MainWindow
 
-# instead of using a cl arg to import the qt binding of our
-# choice at runtime, we could leverage an environment variable,
-# or even attempt to import them in a preferred order in a try
-# block failing gracefully and reporting that these required
+# we could also attempt to import them in a preferred order in
+# a try block failing gracefully and reporting that these required
 # libraries are not installed on the system
 
 class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
@@ -29,7 +26,7 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         self.setupUi(self)
         self.show()
 
-if __name__ == '__main__':
+def main():
     app = QtWidgets.QApplication(sys.argv)
     win = MainWindow()
 
@@ -37,3 +34,6 @@ if __name__ == '__main__':
     # interchangeable, but this isnt the case in PySide2
     # where exec() will raise an AttributeError
     app.exec_()
+
+if __name__ == '__main__':
+    main()
@@ -1,15 +1,9 @@
-import sys
-from PyQt5 import QtWidgets
+import os
 
-from MainWindow import Ui_MainWindow
+# kept for back compatibility: main.py with the PyQt5 binding
+os.environ["QT_API"] = "pyqt5"
 
-class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
-    def __init__(self, *args, **kwargs):
-        super(MainWindow, self).__init__(*args, **kwargs)
-        self.setupUi(self)
-        self.show()
+from main import main
 
 if __name__ == '__main__':
-    app = QtWidgets.QApplication(sys.argv)
-    win = MainWindow()
-    app.exec()
+    main()
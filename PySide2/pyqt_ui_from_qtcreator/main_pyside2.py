@@ -1,17 +1,9 @@
-import sys
-from PySide2 import QtWidgets
+import os
 
-from MainWindow2 import Ui_MainWindow
-
-class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
-
-    def __init__(self, *args, **kwargs):
-        super(MainWindow, self).__init__(*args, **kwargs)
-        self.setupUi(self)
-        self.show()
+# kept for back compatibility: main.py with the PySide2 binding
+os.environ["QT_API"] = "pyside2"
 
+from main import main
 
 if __name__ == '__main__':
-    app = QtWidgets.QApplication(sys.argv)
-    win = MainWindow()
-    app.exec_()
+    main()